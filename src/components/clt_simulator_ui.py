@@ -3,6 +3,8 @@
 Central Limit Theorem Simulator UI Component
 """
 
+import hashlib
+
 import streamlit as st
 import numpy as np
 import plotly.graph_objects as go
@@ -13,14 +15,64 @@ from scipy import stats
 from ..utils.clt_simulator import CLTSimulator
 
 
+# 总体样本使用固定种子，使重复渲染命中同一缓存项
+POPULATION_SEED = 42
+
+# Q-Q图最多绘制的点数，更多的点在视觉上没有区别
+QQ_MAX_POINTS = 500
+
+
+@st.cache_resource
+def _get_simulator():
+    """获取全局共享的模拟器实例"""
+    return CLTSimulator()
+
+
+def _histogram_bins(a, bins=50):
+    """确定直方图的分箱：整数数据使用以各整数为中心的单位宽度箱，否则使用 bins 个等宽箱"""
+    if np.array_equal(a, np.round(a)):
+        return np.arange(a.min() - 0.5, a.max() + 1.5)
+    return bins
+
+
+@st.cache_resource
+def _precomputed_population_hists(size=10000, bins=50):
+    """一次性预先计算所有分布的总体样本直方图 {分布名: (counts, edges)}，
+    总体直方图只取决于分布本身，与模拟参数无关"""
+    simulator = _get_simulator()
+    hists = {}
+    for dist_name in simulator.get_available_distributions():
+        sample = simulator.generate_population_sample(dist_name, size, random_state=POPULATION_SEED)
+        hists[dist_name] = np.histogram(sample, bins=_histogram_bins(sample, bins))
+    return hists
+
+
+def _hash_array(a):
+    """基于数组内容的廉价哈希，用作缓存键"""
+    return hashlib.blake2b(a.tobytes(), digest_size=8).digest()
+
+
+@st.cache_data(hash_funcs={np.ndarray: _hash_array})
+def _cached_density_histogram(sample_means, bins=50):
+    """缓存样本均值的密度直方图 (density, edges)，重新渲染时无需重新分箱"""
+    return np.histogram(sample_means, bins=_histogram_bins(sample_means, bins), density=True)
+
+
+@st.cache_data(hash_funcs={np.ndarray: _hash_array})
+def _cached_normality_test(sample_means):
+    """缓存正态性检验结果，样本均值未变化时不再重复检验"""
+    return _get_simulator().calculate_normality_test(sample_means)
+
+
 def render_clt_simulator():
     """渲染中心极限定理模拟器界面"""
     
     st.title("🎯 中心极限定理交互式模拟器")
     st.markdown("---")
     
-    # 创建模拟器实例
-    simulator = CLTSimulator()
+    # 获取模拟器实例，并预先计算所有分布的总体直方图
+    simulator = _get_simulator()
+    _precomputed_population_hists()
     
     # 侧边栏控制面板
     with st.sidebar:
@@ -53,6 +105,13 @@ def render_clt_simulator():
             help="进行抽样的总次数"
         )
         
+        # 快速模式
+        fast_mode = st.checkbox(
+            "⚡ 快速模式",
+            value=False,
+            help="均匀、正态、指数、伽马和卡方分布直接以单精度抽样，速度更快，精度略有降低"
+        )
+        
         # 开始模拟按钮
         if st.button("🚀 开始模拟", type="primary"):
             st.session_state.run_simulation = True
@@ -80,7 +139,7 @@ def render_clt_simulator():
                 progress_bar.progress(25)
                 
                 sample_means, statistics = simulator.simulate_sampling(
-                    dist_name, sample_size, num_samples
+                    dist_name, sample_size, num_samples, fast_mode=fast_mode
                 )
                 
                 progress_bar.progress(50)
@@ -88,7 +147,7 @@ def render_clt_simulator():
                 
                 # 创建可视化
                 fig = create_clt_visualization(
-                    sample_means, statistics, dist_name, simulator
+                    sample_means, statistics, dist_name
                 )
                 
                 progress_bar.progress(75)
@@ -124,8 +183,7 @@ def render_clt_simulator():
             fig = create_clt_visualization(
                 results['sample_means'], 
                 results['statistics'], 
-                results['dist_name'], 
-                simulator
+                results['dist_name']
             )
             st.plotly_chart(fig, use_container_width=True)
         
@@ -141,7 +199,7 @@ def render_clt_simulator():
             
             # 正态性检验
             st.subheader("🔍 正态性检验")
-            normality_results = simulator.calculate_normality_test(
+            normality_results = _cached_normality_test(
                 st.session_state.last_results['sample_means']
             )
             display_normality_test(normality_results)
@@ -150,7 +208,7 @@ def render_clt_simulator():
             st.info("运行模拟后将显示详细的统计信息")
 
 
-def create_clt_visualization(sample_means, statistics, dist_name, simulator):
+def create_clt_visualization(sample_means, statistics, dist_name):
     """创建中心极限定理可视化图表"""
     
     # 创建子图
@@ -163,17 +221,18 @@ def create_clt_visualization(sample_means, statistics, dist_name, simulator):
             "Q-Q图（正态性检验）"
         ),
         specs=[[{"type": "scatter"}, {"type": "scatter"}],
-               [{"type": "histogram"}, {"type": "scatter"}]]
+               [{"type": "bar"}, {"type": "scatter"}]]
     )
     
     # 1. 原始分布
     try:
-        population_sample = simulator.generate_population_sample(dist_name, 10000)
+        counts, edges = _precomputed_population_hists()[dist_name]
         fig.add_trace(
-            go.Histogram(
-                x=population_sample,
+            go.Bar(
+                x=0.5 * (edges[:-1] + edges[1:]),
+                y=counts,
+                width=np.diff(edges),
                 name=f"原始{dist_name}",
-                nbinsx=50,
                 opacity=0.7,
                 marker_color="lightblue"
             ),
@@ -200,15 +259,16 @@ def create_clt_visualization(sample_means, statistics, dist_name, simulator):
         row=1, col=2
     )
     
-    # 3. 样本均值直方图
+    # 3. 样本均值直方图（服务端预先分箱，只向前端传输各箱高度）
+    density, edges = _cached_density_histogram(sample_means)
     fig.add_trace(
-        go.Histogram(
-            x=sample_means,
+        go.Bar(
+            x=0.5 * (edges[:-1] + edges[1:]),
+            y=density,
+            width=np.diff(edges),
             name="样本均值",
-            nbinsx=50,
             opacity=0.7,
-            marker_color="lightgreen",
-            histnorm='probability density'
+            marker_color="lightgreen"
         ),
         row=2, col=1
     )
@@ -228,13 +288,19 @@ def create_clt_visualization(sample_means, statistics, dist_name, simulator):
     
     # 4. Q-Q图
     try:
-        from scipy.stats import probplot
-        qq_data = probplot(sample_means, dist=stats.norm, plot=None)
+        # 直接计算理论分位数与最小二乘拟合直线
+        n = len(sample_means)
+        sample_quantiles = np.sort(sample_means)
+        theoretical_quantiles = stats.norm.ppf((np.arange(n) + 0.5) / n)
+        slope, intercept = np.polyfit(theoretical_quantiles, sample_quantiles, 1)
+        
+        # 按排序后的顺序均匀抽取最多 QQ_MAX_POINTS 个点绘制，拟合仍使用全部数据
+        idx = np.linspace(0, n - 1, min(n, QQ_MAX_POINTS)).astype(int)
         
         fig.add_trace(
             go.Scatter(
-                x=qq_data[0][0],
-                y=qq_data[0][1],
+                x=theoretical_quantiles[idx],
+                y=sample_quantiles[idx],
                 mode='markers',
                 name='Q-Q点',
                 marker=dict(color='blue', size=4)
@@ -245,8 +311,8 @@ def create_clt_visualization(sample_means, statistics, dist_name, simulator):
         # 添加理论直线
         fig.add_trace(
             go.Scatter(
-                x=qq_data[0][0],
-                y=qq_data[1][1] + qq_data[1][0] * qq_data[0][0],
+                x=theoretical_quantiles[idx],
+                y=intercept + slope * theoretical_quantiles[idx],
                 mode='lines',
                 name='理论直线',
                 line=dict(color='red', width=2),
@@ -14,14 +14,37 @@ from scipy import stats
 from ..utils.distribution_explorer import DistributionExplorer
 
 
+@st.cache_resource
+def _get_explorer():
+    """获取全局共享的探索器实例"""
+    return DistributionExplorer()
+
+
+def _params_key(params):
+    """将参数字典转换为可哈希的有序元组，用作缓存键"""
+    return tuple(sorted(params.items()))
+
+
+@st.cache_data
+def _cached_distribution_info(dist_name, params_tuple):
+    """缓存分布信息，参数未变化时跳过scipy计算"""
+    return _get_explorer().get_distribution_info(dist_name, dict(params_tuple))
+
+
+@st.cache_data
+def _cached_pdf_pmf(dist_name, params_tuple, x_range):
+    """缓存PDF/PMF计算结果"""
+    return _get_explorer().calculate_pdf_pmf(dist_name, dict(params_tuple), x_range)
+
+
 def render_distribution_explorer():
     """渲染概率分布探索器界面"""
     
     st.title("🔍 经典概率分布探索器")
     st.markdown("---")
     
-    # 创建探索器实例
-    explorer = DistributionExplorer()
+    # 获取探索器实例
+    explorer = _get_explorer()
     
     # 获取可用分布
     available_distributions = explorer.get_available_distributions()
@@ -44,28 +67,31 @@ def render_distribution_explorer():
             help="选择要探索的具体分布"
         )
         
-        # 动态参数控制
+        # 动态参数控制（放在表单中，拖动滑块时不触发重新计算，点击按钮后统一应用）
         st.markdown("### 📊 参数调整")
         params = {}
         param_configs = explorer.get_param_config(dist_name)
         
-        for param_name, config in param_configs.items():
-            if config["step"] == 1:  # 整数参数
-                params[param_name] = st.slider(
-                    config["name"],
-                    min_value=int(config["min"]),
-                    max_value=int(config["max"]),
-                    value=int(config["default"]),
-                    step=int(config["step"])
-                )
-            else:  # 浮点数参数
-                params[param_name] = st.slider(
-                    config["name"],
-                    min_value=float(config["min"]),
-                    max_value=float(config["max"]),
-                    value=float(config["default"]),
-                    step=float(config["step"])
-                )
+        with st.form("params"):
+            for param_name, config in param_configs.items():
+                if config["step"] == 1:  # 整数参数
+                    params[param_name] = st.slider(
+                        config["name"],
+                        min_value=int(config["min"]),
+                        max_value=int(config["max"]),
+                        value=int(config["default"]),
+                        step=int(config["step"])
+                    )
+                else:  # 浮点数参数
+                    params[param_name] = st.slider(
+                        config["name"],
+                        min_value=float(config["min"]),
+                        max_value=float(config["max"]),
+                        value=float(config["default"]),
+                        step=float(config["step"])
+                    )
+            
+            st.form_submit_button("应用参数", type="primary")
         
         # 图表设置
         st.markdown("### 🎨 图表设置")
@@ -93,11 +119,20 @@ def render_distribution_explorer():
         st.subheader("📈 分布可视化")
         
         try:
+            params_tuple = _params_key(params)
+            state_key = (dist_name, params_tuple, x_range)
+            
+            if st.session_state.get('last_dist_key') != state_key:
+                # 首次加载、切换分布或提交了新参数时才重新计算
+                st.session_state.last_dist_info = _cached_distribution_info(dist_name, params_tuple)
+                st.session_state.last_pdf_pmf = _cached_pdf_pmf(dist_name, params_tuple, x_range)
+                st.session_state.last_dist_key = state_key
+            
             # 获取分布信息
-            dist_info = explorer.get_distribution_info(dist_name, params)
+            dist_info = st.session_state.last_dist_info
             
             # 计算PDF/PMF
-            x, y = explorer.calculate_pdf_pmf(dist_name, params, x_range)
+            x, y = st.session_state.last_pdf_pmf
             
             # 创建可视化
             fig = create_distribution_plot(
@@ -0,0 +1,208 @@
+"""
+数值计算加速内核
+Numeric Acceleration Kernels
+
+numba 为可选依赖：未安装时 row_means 回退到等价的 NumPy 实现，其余内核以纯 Python 运行。
+"""
+
+import math
+
+import numpy as np
+from scipy import special
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+
+    # 不使用 parallel=True：Streamlit 各会话在各自线程中运行脚本，numba 的默认
+    # 线程层（workqueue）被多个线程并发进入时会中止整个进程；每次只处理不超过
+    # SAMPLING_CHUNK_ROWS 行的块，并行本身也无收益
+    @njit(fastmath=True, cache=True)
+    def row_means(x):
+        """按行求均值（二维数组）"""
+        out = np.empty(x.shape[0])
+        for i in range(x.shape[0]):
+            s = 0.0
+            row = x[i]
+            for j in range(row.shape[0]):
+                s += row[j]
+            out[i] = s / row.shape[0]
+        return out
+
+else:
+
+    def row_means(x):
+        """按行求均值（二维数组）"""
+        return x.mean(axis=1, dtype=np.float64)
+
+
+# Royston (1995, AS R94) 中 a_n、a_{n-1} 系数的多项式修正项（关于 u = 1/√n）
+_SHAPIRO_C1 = np.array([0.0, 0.221157, -0.147981, -2.071190, 4.434685, -2.706056])
+_SHAPIRO_C2 = np.array([0.0, 0.042981, -0.293762, -1.752461, 5.682633, -3.582633])
+
+
+def _poly(c, u):
+    """按升幂计算多项式 c[0] + c[1]·u + ... 的值"""
+    value = 0.0
+    for k in range(c.shape[0] - 1, -1, -1):
+        value = value * u + c[k]
+    return value
+
+
+def _shapiro_w(x, m):
+    """
+    Shapiro-Wilk W 统计量（Royston 近似系数）
+    
+    Args:
+        x: 升序排列的样本（n ≥ 4）
+        m: 对应的正态分数 Φ⁻¹((i - 3/8) / (n + 1/4))
+    """
+    n = x.shape[0]
+    summ2 = 0.0
+    total = 0.0
+    for i in range(n):
+        summ2 += m[i] * m[i]
+        total += x[i]
+    ssumm2 = math.sqrt(summ2)
+    u = 1.0 / math.sqrt(n)
+    
+    # 两端的系数使用多项式修正，中间的系数按 m_i / √φ 归一化
+    a_n = m[n - 1] / ssumm2 + _poly(_SHAPIRO_C1, u)
+    if n > 5:
+        a_n1 = m[n - 2] / ssumm2 + _poly(_SHAPIRO_C2, u)
+        phi = (summ2 - 2.0 * m[n - 1] ** 2 - 2.0 * m[n - 2] ** 2) / (1.0 - 2.0 * a_n ** 2 - 2.0 * a_n1 ** 2)
+        edge = 2
+    else:
+        a_n1 = 0.0
+        phi = (summ2 - 2.0 * m[n - 1] ** 2) / (1.0 - 2.0 * a_n ** 2)
+        edge = 1
+    scale = 1.0 / math.sqrt(phi)
+    
+    mean = total / n
+    numerator = 0.0
+    ssq = 0.0
+    for i in range(n):
+        if i == 0:
+            a = -a_n
+        elif i == n - 1:
+            a = a_n
+        elif edge == 2 and i == 1:
+            a = -a_n1
+        elif edge == 2 and i == n - 2:
+            a = a_n1
+        else:
+            a = m[i] * scale
+        numerator += a * x[i]
+        d = x[i] - mean
+        ssq += d * d
+    
+    return min(numerator * numerator / ssq, 1.0)
+
+
+if NUMBA_AVAILABLE:
+    _poly = njit(cache=True)(_poly)
+    _shapiro_w = njit(cache=True)(_shapiro_w)
+
+
+def shapiro_royston(x_sorted):
+    """
+    Shapiro-Wilk 正态性检验（Royston 近似，适用于 12 ≤ n ≤ 5000）
+    
+    Args:
+        x_sorted: 升序排列的样本
+        
+    Returns:
+        (W 统计量, p 值)
+    """
+    n = x_sorted.shape[0]
+    m = special.ndtri((np.arange(1, n + 1) - 0.375) / (n + 0.25))
+    w = _shapiro_w(np.ascontiguousarray(x_sorted, dtype=np.float64), m)
+    
+    # ln(1 - W) 近似服从正态分布，均值和标准差为 ln(n) 的函数
+    ln_n = math.log(n)
+    mu = ((0.0038915 * ln_n - 0.083751) * ln_n - 0.31082) * ln_n - 1.5861
+    sigma = math.exp((0.0030302 * ln_n - 0.082676) * ln_n - 0.4803)
+    if w >= 1.0:
+        return w, 1.0
+    z = (math.log1p(-w) - mu) / sigma
+    return w, float(special.ndtr(-z))
+
+
+# 常用分布的 PDF/PMF 闭式内核：参数已验证，按 scipy 的参数顺序传入，结果写入预分配的 out，支撑集外为 0
+_INV_SQRT_2PI = 1.0 / math.sqrt(2.0 * math.pi)
+
+
+def norm_pdf(x, loc, scale, out):
+    """正态分布 PDF"""
+    for i in range(x.shape[0]):
+        z = (x[i] - loc) / scale
+        out[i] = math.exp(-0.5 * z * z) * _INV_SQRT_2PI / scale
+    return out
+
+
+def uniform_pdf(x, loc, scale, out):
+    """均匀分布 PDF，支撑集为 [loc, loc + scale]"""
+    for i in range(x.shape[0]):
+        out[i] = 1.0 / scale if loc <= x[i] <= loc + scale else 0.0
+    return out
+
+
+def expon_pdf(x, scale, out):
+    """指数分布 PDF"""
+    for i in range(x.shape[0]):
+        out[i] = math.exp(-x[i] / scale) / scale if x[i] >= 0.0 else 0.0
+    return out
+
+
+def poisson_pmf(k, mu, out):
+    """泊松分布 PMF"""
+    log_mu = math.log(mu)
+    for i in range(k.shape[0]):
+        if k[i] < 0:
+            out[i] = 0.0
+        else:
+            out[i] = math.exp(k[i] * log_mu - mu - math.lgamma(k[i] + 1.0))
+    return out
+
+
+def binom_pmf(k, n, p, out):
+    """二项分布 PMF"""
+    log_p = math.log(p)
+    log_q = math.log1p(-p)
+    log_n_fact = math.lgamma(n + 1.0)
+    for i in range(k.shape[0]):
+        if k[i] < 0 or k[i] > n:
+            out[i] = 0.0
+        else:
+            out[i] = math.exp(log_n_fact - math.lgamma(k[i] + 1.0) - math.lgamma(n - k[i] + 1.0)
+                              + k[i] * log_p + (n - k[i]) * log_q)
+    return out
+
+
+def nbinom_pmf(k, n, p, out):
+    """负二项分布 PMF（成功 n 次前的失败次数）"""
+    log_p = math.log(p)
+    log_q = math.log1p(-p)
+    log_gamma_n = math.lgamma(n)
+    for i in range(k.shape[0]):
+        if k[i] < 0:
+            out[i] = 0.0
+        else:
+            out[i] = math.exp(math.lgamma(k[i] + n) - math.lgamma(k[i] + 1.0) - log_gamma_n
+                              + n * log_p + k[i] * log_q)
+    return out
+
+
+if NUMBA_AVAILABLE:
+    _kernel = njit(cache=True, fastmath=True)
+    norm_pdf = _kernel(norm_pdf)
+    uniform_pdf = _kernel(uniform_pdf)
+    expon_pdf = _kernel(expon_pdf)
+    poisson_pmf = _kernel(poisson_pmf)
+    binom_pmf = _kernel(binom_pmf)
+    nbinom_pmf = _kernel(nbinom_pmf)
@@ -3,11 +3,89 @@
 Central Limit Theorem Simulator Core Logic
 """
 
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 from scipy import stats
-from typing import Dict, List, Tuple, Any
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import pandas as pd
 
+from ._fast import NUMBA_AVAILABLE, row_means, shapiro_royston
+
+
+# 分块抽样时每块的行数（抽样次数），使每块数据能驻留在缓存中
+SAMPLING_CHUNK_ROWS = 512
+
+# 总抽样数达到该值时才启用多线程并行抽样，小规模时线程调度开销得不偿失。
+# 约 26 万次抽样（正态分布单线程约 2 ms）时线程池的额外开销约 0.2 ms，
+# 界面的常见配置（如 5000 × 200）均在阈值之上
+PARALLEL_MIN_DRAWS = 1 << 18
+
+# Royston 近似的 Shapiro-Wilk 检验（numba 加速）适用的样本量范围，范围外使用 scipy
+SHAPIRO_ROYSTON_MIN_N = 12
+SHAPIRO_ROYSTON_MAX_N = 5000
+
+# 各分布对应的 Generator 抽样函数工厂：传入分布参数，返回参数已固化的 sampler(rng, size)
+_GENERATOR_SAMPLER_FACTORIES = {
+    "均匀分布": lambda loc, scale: lambda rng, size: rng.uniform(loc, loc + scale, size),
+    "正态分布": lambda loc, scale: lambda rng, size: rng.normal(loc, scale, size),
+    "指数分布": lambda scale: lambda rng, size: rng.exponential(scale, size),
+    "泊松分布": lambda mu: lambda rng, size: rng.poisson(mu, size),
+    "伽马分布": lambda a, scale: lambda rng, size: rng.gamma(a, scale, size),
+    "贝塔分布": lambda a, b: lambda rng, size: rng.beta(a, b, size),
+    "卡方分布": lambda df: lambda rng, size: rng.chisquare(df, size),
+    "二项分布": lambda n, p: lambda rng, size: rng.binomial(n, p, size)
+}
+
+
+def _affine(draw: Callable[[np.random.Generator, Any], np.ndarray],
+            scale: float, shift: float = 0.0) -> Callable[[np.random.Generator, Any], np.ndarray]:
+    """返回 sampler(rng, size)：对标准分布的抽样结果原地乘以 scale 再加 shift，保持原 dtype"""
+    def sampler(rng, size):
+        x = draw(rng, size)
+        x *= scale
+        if shift:
+            x += shift
+        return x
+    return sampler
+
+
+# 快速模式下直接以单精度抽样的分布（Generator 的标准分布抽样支持 dtype=np.float32），
+# 省去双精度抽样再转换的额外拷贝；其余分布仍使用双精度抽样函数
+_FLOAT32_SAMPLER_FACTORIES = {
+    "均匀分布": lambda loc, scale: _affine(
+        lambda rng, size: rng.random(size, dtype=np.float32), scale, loc),
+    "正态分布": lambda loc, scale: _affine(
+        lambda rng, size: rng.standard_normal(size, dtype=np.float32), scale, loc),
+    "指数分布": lambda scale: _affine(
+        lambda rng, size: rng.standard_exponential(size, dtype=np.float32), scale),
+    "伽马分布": lambda a, scale: _affine(
+        lambda rng, size: rng.standard_gamma(a, size, dtype=np.float32), scale),
+    # χ²(ν) 即形状 ν/2、尺度 2 的伽马分布
+    "卡方分布": lambda df: _affine(
+        lambda rng, size: rng.standard_gamma(df / 2, size, dtype=np.float32), 2.0)
+}
+
+# 各分布理论 (均值, 方差) 的闭式表达式，省去 scipy 的通用矩计算
+_THEORETICAL_MOMENTS = {
+    "均匀分布": lambda loc, scale: (loc + scale / 2, scale ** 2 / 12),
+    "正态分布": lambda loc, scale: (loc, scale ** 2),
+    "指数分布": lambda scale: (scale, scale ** 2),
+    "泊松分布": lambda mu: (mu, mu),
+    "伽马分布": lambda a, scale: (a * scale, a * scale ** 2),
+    "贝塔分布": lambda a, b: (a / (a + b), a * b / ((a + b) ** 2 * (a + b + 1))),
+    "卡方分布": lambda df: (df, 2 * df),
+    "二项分布": lambda n, p: (n * p, n * p * (1 - p))
+}
+
+
+@functools.lru_cache(maxsize=32)
+def _freeze(func, params_tuple: Tuple[Tuple[str, Any], ...]):
+    """创建并缓存冻结的 scipy 分布对象，避免重复的参数检查"""
+    return func(**dict(params_tuple))
+
 
 class CLTSimulator:
     """中心极限定理模拟器"""
@@ -23,16 +101,44 @@ class CLTSimulator:
             "卡方分布": {"func": stats.chi2, "params": {"df": 3}},
             "二项分布": {"func": stats.binom, "params": {"n": 10, "p": 0.3}}
         }
+        # 共享的随机数生成器，避免每次抽样重复创建
+        self._rng = np.random.default_rng()
+        # 与上述分布等价的 Generator 抽样函数，参数在此一次性固化，
+        # 抽样时无需查找参数字典、展开关键字参数或经过 scipy rvs 的参数检查
+        self._samplers = {
+            name: factory(**self.distributions[name]["params"])
+            for name, factory in _GENERATOR_SAMPLER_FACTORIES.items()
+        }
+        self._samplers32 = {
+            name: factory(**self.distributions[name]["params"])
+            for name, factory in _FLOAT32_SAMPLER_FACTORIES.items()
+        }
     
     def get_distribution_info(self, dist_name: str) -> Dict[str, Any]:
         """获取分布信息"""
-        if dist_name not in self.distributions:
-            raise ValueError(f"不支持的分布: {dist_name}")
-        
+        dist = self._frozen(dist_name)
         dist_info = self.distributions[dist_name]
-        dist = dist_info["func"](**dist_info["params"])
         
-        # 计算理论统计量
+        # 计算理论统计量，优先使用闭式表达式
+        moments = _THEORETICAL_MOMENTS.get(dist_name)
+        if moments is not None:
+            mean, var = moments(**dist_info["params"])
+            std = np.sqrt(var)
+        else:
+            mean, var, std = self._scipy_moments(dist)
+        
+        return {
+            "name": dist_name,
+            "distribution": dist,
+            "params": dist_info["params"],
+            "theoretical_mean": mean,
+            "theoretical_var": var,
+            "theoretical_std": std
+        }
+    
+    @staticmethod
+    def _scipy_moments(dist) -> Tuple[float, float, float]:
+        """通过 scipy 计算理论均值、方差和标准差"""
         try:
             mean = dist.mean()
             var = dist.var()
@@ -43,22 +149,39 @@ class CLTSimulator:
             var = np.nan
             std = np.nan
         
-        return {
-            "name": dist_name,
-            "distribution": dist,
-            "params": dist_info["params"],
-            "theoretical_mean": mean,
-            "theoretical_var": var,
-            "theoretical_std": std
-        }
+        return mean, var, std
     
-    def generate_population_sample(self, dist_name: str, size: int = 10000) -> np.ndarray:
-        """生成总体样本"""
-        dist_info = self.get_distribution_info(dist_name)
-        return dist_info["distribution"].rvs(size=size)
+    def _frozen(self, dist_name: str):
+        """获取指定分布的冻结 scipy 分布对象（按分布名与参数缓存）"""
+        if dist_name not in self.distributions:
+            raise ValueError(f"不支持的分布: {dist_name}")
+        
+        dist_info = self.distributions[dist_name]
+        return _freeze(dist_info["func"], tuple(sorted(dist_info["params"].items())))
+    
+    def generate_population_sample(self, dist_name: str, size: int = 10000,
+                                   random_state=None) -> np.ndarray:
+        """生成总体样本，random_state 为空时使用模拟器自身的随机数生成器"""
+        rng = self._rng if random_state is None else np.random.default_rng(random_state)
+        return self._sampler(dist_name)(rng, size)
+    
+    def _sampler(self, dist_name: str,
+                 float32: bool = False) -> Callable[[np.random.Generator, Any], np.ndarray]:
+        """
+        获取指定分布的抽样函数 sampler(rng, size)，优先使用 Generator 抽样函数，否则回退到 scipy rvs；
+        float32 为真时优先使用单精度抽样函数
+        """
+        sampler = self._samplers32.get(dist_name) if float32 else None
+        if sampler is None:
+            sampler = self._samplers.get(dist_name)
+        if sampler is None:
+            distribution = self._frozen(dist_name)
+            sampler = lambda rng, size: distribution.rvs(size=size, random_state=rng)
+        return sampler
     
     def simulate_sampling(self, dist_name: str, sample_size: int, 
-                         num_samples: int) -> Tuple[np.ndarray, Dict[str, float]]:
+                         num_samples: int, fast_mode: bool = False,
+                         n_jobs: Optional[int] = None) -> Tuple[np.ndarray, Dict[str, float]]:
         """
         模拟抽样过程
         
@@ -66,26 +189,56 @@ class CLTSimulator:
             dist_name: 分布名称
             sample_size: 每次抽样的样本大小
             num_samples: 抽样次数
+            fast_mode: 快速模式，支持的分布直接以单精度抽样并计算均值
+            n_jobs: 并行线程数，默认在抽样规模较大时使用全部CPU核心
             
         Returns:
             sample_means: 样本均值数组
             statistics: 统计信息字典
         """
         dist_info = self.get_distribution_info(dist_name)
-        distribution = dist_info["distribution"]
         
-        # 进行多次抽样
-        sample_means = []
-        for _ in range(num_samples):
-            sample = distribution.rvs(size=sample_size)
-            sample_means.append(np.mean(sample))
+        # 分块抽样（每块 SAMPLING_CHUNK_ROWS × sample_size），抽完立即按行求均值，
+        # 峰值内存只与块大小有关，而与抽样次数无关
+        draw = self._sampler(dist_name, float32=fast_mode)
+        sample_means = np.empty(num_samples, dtype=np.float32 if fast_mode else np.float64)
+        starts = range(0, num_samples, SAMPLING_CHUNK_ROWS)
+        
+        if n_jobs is None:
+            n_jobs = (os.cpu_count() or 1) if num_samples * sample_size >= PARALLEL_MIN_DRAWS else 1
+        n_jobs = min(n_jobs, len(starts))
+        
+        def fill_chunk(start, rng, reduce_rows):
+            n = min(SAMPLING_CHUNK_ROWS, num_samples - start)
+            block = draw(rng, (n, sample_size))
+            if block.dtype == np.float32:
+                # 单精度抽样减半内存带宽，展示所需的精度仍然足够
+                sample_means[start:start + n] = block.mean(axis=1, dtype=np.float32)
+            else:
+                # 不支持单精度抽样的分布不做类型转换，避免额外的拷贝
+                sample_means[start:start + n] = reduce_rows(block)
         
-        sample_means = np.array(sample_means)
+        if n_jobs > 1:
+            # 各块独立同分布，分配给多个线程并行抽样（NumPy 抽样时会释放 GIL）。
+            # 每块使用从主生成器派生的独立子生成器，保证各块随机流互不重叠；
+            # 线程内使用 NumPy 求均值，NumPy 归约时同样会释放 GIL
+            rngs = self._rng.spawn(len(starts))
+            numpy_row_means = functools.partial(np.mean, axis=1)
+            with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+                list(executor.map(fill_chunk, starts, rngs, [numpy_row_means] * len(starts)))
+        else:
+            for start in starts:
+                fill_chunk(start, self._rng, row_means)
         
-        # 计算样本均值的统计量
-        sample_mean_mean = np.mean(sample_means)
-        sample_mean_var = np.var(sample_means, ddof=1)
-        sample_mean_std = np.std(sample_means, ddof=1)
+        # 计算样本均值的统计量（始终使用双精度）：一次求和加一次点积，
+        # 由和与平方和推出均值、方差和标准差
+        means64 = sample_means.astype(np.float64, copy=False)
+        n = means64.size
+        total = means64.sum()
+        total_sq = np.dot(means64, means64)
+        sample_mean_mean = total / n
+        sample_mean_var = max(total_sq - total * total / n, 0.0) / (n - 1)
+        sample_mean_std = np.sqrt(sample_mean_var)
         
         # 理论值（根据中心极限定理）
         theoretical_mean = dist_info["theoretical_mean"]
@@ -107,7 +260,11 @@ class CLTSimulator:
         """计算正态性检验"""
         try:
             # Shapiro-Wilk检验
-            shapiro_stat, shapiro_p = stats.shapiro(sample_means)
+            n = len(sample_means)
+            if NUMBA_AVAILABLE and SHAPIRO_ROYSTON_MIN_N <= n <= SHAPIRO_ROYSTON_MAX_N:
+                shapiro_stat, shapiro_p = shapiro_royston(np.sort(sample_means))
+            else:
+                shapiro_stat, shapiro_p = stats.shapiro(sample_means)
             
             # Kolmogorov-Smirnov检验
             ks_stat, ks_p = stats.kstest(sample_means, 'norm', 
@@ -3,265 +3,532 @@
 Probability Distribution Explorer Core Logic
 """
 
+import functools
+from dataclasses import dataclass
+from types import MappingProxyType
+
 import numpy as np
 from scipy import stats
-from typing import Dict, List, Tuple, Any, Union
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Union
 import pandas as pd
 
+from ._fast import (NUMBA_AVAILABLE, binom_pmf, expon_pdf, nbinom_pmf, norm_pdf,
+                    poisson_pmf, uniform_pdf)
+
+
+@dataclass(frozen=True, slots=True)
+class ParamSpec:
+    """分布参数配置"""
+    name: str       # 显示名称
+    key: str        # scipy 参数名
+    default: float
+    min: float
+    max: float
+    step: float
+
+
+@dataclass(frozen=True, slots=True)
+class DistInfo:
+    """分布配置"""
+    type: str       # "continuous" 或 "discrete"
+    func: Any       # scipy.stats 分布
+    params: Tuple[ParamSpec, ...]
+    support: str
+    # 由参数直接给出绘图区间 (x_min, x_max) 的闭式表达式，返回 None 时回退到分位数
+    plot_range: Optional[Callable[..., Optional[Tuple[float, float]]]] = None
+    # 由参数判断均值等矩是否存在，为 None 表示总是存在
+    has_finite_moments: Optional[Callable[..., bool]] = None
+
+
+# 所有分布的配置，在模块导入时构建一次，所有探索器实例共享
+DISTRIBUTIONS: Mapping[str, DistInfo] = MappingProxyType({
+    # 连续分布
+    "正态分布": DistInfo(
+        type="continuous",
+        func=stats.norm,
+        params=(
+            ParamSpec("均值 (μ)", "loc", default=0, min=-10, max=10, step=0.1),
+            ParamSpec("标准差 (σ)", "scale", default=1, min=0.1, max=5, step=0.1),
+        ),
+        support="(-∞, +∞)",
+        plot_range=lambda loc, scale: (loc - 4 * scale, loc + 4 * scale)
+    ),
+    "均匀分布": DistInfo(
+        type="continuous",
+        func=stats.uniform,
+        params=(
+            ParamSpec("下界 (a)", "loc", default=0, min=-5, max=5, step=0.1),
+            ParamSpec("区间长度 (b-a)", "scale", default=1, min=0.1, max=10, step=0.1),
+        ),
+        support="[a, b]",
+        # 两端各留出 10% 的空白，网格点不落在密度的跳跃处，同时显示出阶跃边缘
+        plot_range=lambda loc, scale: (loc - 0.1 * scale, loc + 1.1 * scale)
+    ),
+    "指数分布": DistInfo(
+        type="continuous",
+        func=stats.expon,
+        params=(
+            ParamSpec("尺度参数 (1/λ)", "scale", default=1, min=0.1, max=5, step=0.1),
+        ),
+        support="[0, +∞)",
+        plot_range=lambda scale: (0, 7 * scale)
+    ),
+    "伽马分布": DistInfo(
+        type="continuous",
+        func=stats.gamma,
+        params=(
+            ParamSpec("形状参数 (α)", "a", default=2, min=0.1, max=10, step=0.1),
+            ParamSpec("尺度参数 (β)", "scale", default=1, min=0.1, max=5, step=0.1),
+        ),
+        support="[0, +∞)",
+        # α < 1 时密度在 0 处无界，交给分位数确定区间
+        plot_range=lambda a, scale: (0, (a + 6 * np.sqrt(a)) * scale) if a >= 1 else None
+    ),
+    "贝塔分布": DistInfo(
+        type="continuous",
+        func=stats.beta,
+        params=(
+            ParamSpec("形状参数 (α)", "a", default=2, min=0.1, max=10, step=0.1),
+            ParamSpec("形状参数 (β)", "b", default=5, min=0.1, max=10, step=0.1),
+        ),
+        support="[0, 1]",
+        plot_range=lambda a, b: (0, 1) if a >= 1 and b >= 1 else None
+    ),
+    "卡方分布": DistInfo(
+        type="continuous",
+        func=stats.chi2,
+        params=(
+            ParamSpec("自由度 (ν)", "df", default=3, min=1, max=20, step=1),
+        ),
+        support="[0, +∞)",
+        plot_range=lambda df: (0, df + 6 * np.sqrt(2 * df)) if df >= 2 else None
+    ),
+    "t分布": DistInfo(
+        type="continuous",
+        func=stats.t,
+        params=(
+            ParamSpec("自由度 (ν)", "df", default=5, min=1, max=30, step=1),
+        ),
+        support="(-∞, +∞)",
+        # ν ≤ 2 时方差不存在，交给分位数确定区间
+        plot_range=lambda df: (-4 * np.sqrt(df / (df - 2)), 4 * np.sqrt(df / (df - 2))) if df > 2 else None,
+        # ν = 1 时为柯西分布，均值不存在
+        has_finite_moments=lambda df: df > 1
+    ),
+    "F分布": DistInfo(
+        type="continuous",
+        func=stats.f,
+        params=(
+            ParamSpec("分子自由度", "dfn", default=5, min=1, max=20, step=1),
+            ParamSpec("分母自由度", "dfd", default=10, min=1, max=30, step=1),
+        ),
+        support="[0, +∞)",
+        # 分母自由度不超过 2 时均值不存在
+        has_finite_moments=lambda dfn, dfd: dfd > 2
+    ),
+    # 离散分布
+    "二项分布": DistInfo(
+        type="discrete",
+        func=stats.binom,
+        params=(
+            ParamSpec("试验次数 (n)", "n", default=10, min=1, max=100, step=1),
+            ParamSpec("成功概率 (p)", "p", default=0.3, min=0.01, max=0.99, step=0.01),
+        ),
+        support="{0, 1, 2, ..., n}"
+    ),
+    "泊松分布": DistInfo(
+        type="discrete",
+        func=stats.poisson,
+        params=(
+            ParamSpec("强度参数 (λ)", "mu", default=3, min=0.1, max=20, step=0.1),
+        ),
+        support="{0, 1, 2, ...}"
+    ),
+    "几何分布": DistInfo(
+        type="discrete",
+        func=stats.geom,
+        params=(
+            ParamSpec("成功概率 (p)", "p", default=0.3, min=0.01, max=0.99, step=0.01),
+        ),
+        support="{1, 2, 3, ...}"
+    ),
+    "负二项分布": DistInfo(
+        type="discrete",
+        func=stats.nbinom,
+        params=(
+            ParamSpec("成功次数 (r)", "n", default=5, min=1, max=20, step=1),
+            ParamSpec("成功概率 (p)", "p", default=0.3, min=0.01, max=0.99, step=0.01),
+        ),
+        support="{0, 1, 2, ...}"
+    )
+})
+
+
+# 离散分布自动区间舍去的尾部概率（两端合计），以及区间内的最大点数
+DISCRETE_TAIL_MASS = 1e-4
+DISCRETE_MAX_POINTS = 500
+
+# 按类型分组的分布名称，配置不可变，只需在导入时构建一次
+_AVAILABLE_DISTRIBUTIONS: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    "连续分布": tuple(name for name, config in DISTRIBUTIONS.items() if config.type == "continuous"),
+    "离散分布": tuple(name for name, config in DISTRIBUTIONS.items() if config.type != "continuous")
+})
+
+
+def _make_validator(params: Tuple[ParamSpec, ...]) -> Callable[[Dict[str, float]], Dict[str, float]]:
+    """
+    为一个分布生成专用的参数验证函数：参数名、默认值和上下界以常量形式内联，
+    函数体只是一个字典字面量，例如
+    {'loc': min(10, max(-10, get('loc', 0))), 'scale': min(5, max(0.1, get('scale', 1)))}
+    """
+    entries = ", ".join(
+        f"{spec.key!r}: min({spec.max!r}, max({spec.min!r}, get({spec.key!r}, {spec.default!r})))"
+        for spec in params
+    )
+    source = f"def validate(params):\n    get = params.get\n    return {{{entries}}}\n"
+    namespace = {}
+    exec(source, namespace)
+    return namespace["validate"]
+
+
+# 各分布的参数验证函数，在导入时生成一次
+_VALIDATORS = {name: _make_validator(config.params) for name, config in DISTRIBUTIONS.items()}
+
+
+# 有闭式 PDF/PMF 内核的分布（参数按配置顺序传入）；内核只在 numba 可用时启用，
+# 否则纯 Python 循环反而比 scipy 慢
+_FAST_DENSITIES = {
+    "正态分布": norm_pdf,
+    "均匀分布": uniform_pdf,
+    "指数分布": expon_pdf,
+    "二项分布": binom_pmf,
+    "泊松分布": poisson_pmf,
+    "负二项分布": nbinom_pmf
+} if NUMBA_AVAILABLE else {}
+
+# 各分布参数的默认值，用于补全调用方未提供的参数
+_PARAM_DEFAULTS = {
+    name: {spec.key: spec.default for spec in config.params}
+    for name, config in DISTRIBUTIONS.items()
+}
+
+# 各分布的应用场景描述模板，调用时只格式化所需的一条
+_SCENARIO_TEMPLATES = {
+    "正态分布": "身高分布：平均身高{loc:.1f}cm，标准差{scale:.1f}cm的人群身高分布。",
+    "均匀分布": "随机数生成：在[{loc:.1f}, {upper:.1f}]区间内均匀分布的随机数。",
+    "指数分布": "设备寿命：平均寿命为{scale:.1f}年的电子设备的寿命分布。",
+    "伽马分布": "等待时间：等待第{a:.0f}个客户到达的时间分布，平均间隔{scale:.1f}分钟。",
+    "贝塔分布": "成功率：在{a:.0f}次成功和{b:.0f}次失败后，真实成功率的分布。",
+    "卡方分布": "方差检验：{df:.0f}个独立标准正态变量平方和的分布。",
+    "t分布": "小样本均值：样本量为{df:.0f}+1的样本均值的标准化分布。",
+    "F分布": "方差比检验：两个独立卡方分布（自由度{dfn:.0f}和{dfd:.0f}）比值的分布。",
+    "二项分布": "质量控制：{n:.0f}个产品中，每个产品合格率为{p:.1%}时的合格产品数量分布。",
+    "泊松分布": "客流统计：平均每小时有{mu:.1f}位客户到达的商店客流分布。",
+    "几何分布": "首次成功：成功概率为{p:.1%}的试验中，首次成功所需的试验次数分布。",
+    "负二项分布": "重复试验：成功概率为{p:.1%}时，获得{n:.0f}次成功所需的失败次数分布。"
+}
+
+# 场景描述模板中由参数派生的字段
+_SCENARIO_DERIVED = {
+    "upper": lambda params: params["loc"] + params["scale"]
+}
+
+
+class _ScenarioParams(dict):
+    """场景描述模板的格式化参数，缺失的字段取派生值或分布的默认值"""
+    
+    __slots__ = ("defaults",)
+    
+    def __init__(self, params: Dict[str, float], defaults: Dict[str, float]):
+        super().__init__(params)
+        self.defaults = defaults
+    
+    def __missing__(self, key: str) -> float:
+        derive = _SCENARIO_DERIVED.get(key)
+        return derive(self) if derive is not None else self.defaults[key]
+
+
+@functools.lru_cache(maxsize=512)
+def _freeze(dist_name: str, params_tuple: Tuple[Tuple[str, float], ...]):
+    """创建冻结的 scipy 分布对象（参数已验证），不计算任何统计量"""
+    return DISTRIBUTIONS[dist_name].func(**dict(params_tuple))
+
+
+@functools.lru_cache(maxsize=512)
+def _cached_info(dist_name: str, params_tuple: Tuple[Tuple[str, float], ...]) -> Dict[str, Any]:
+    """计算分布信息（参数已验证），按 (分布名, 参数元组) 缓存"""
+    dist_config = DISTRIBUTIONS[dist_name]
+    validated_params = dict(params_tuple)
+    
+    # 创建分布对象
+    distribution = _freeze(dist_name, params_tuple)
+    
+    # 计算统计量：矩不存在时（如柯西分布）直接记为 NaN，不调用 scipy
+    has_finite_moments = dist_config.has_finite_moments
+    if has_finite_moments is None or has_finite_moments(**validated_params):
+        # 一次调用同时取得均值和方差，标准差由方差开方得到
+        mean, var = distribution.stats(moments='mv')
+        std = np.sqrt(var)
+        if dist_config.type == "continuous":
+            skewness, kurtosis = distribution.stats(moments='sk')
+        else:
+            skewness = kurtosis = None
+    else:
+        mean = var = std = skewness = kurtosis = np.nan
+    
+    # 对于连续分布，一次调用计算三个分位数
+    if dist_config.type == "continuous":
+        q25, q50, q75 = distribution.ppf([0.25, 0.5, 0.75])  # q50 为中位数
+    else:
+        q25 = q50 = q75 = None
+    
+    return {
+        "name": dist_name,
+        "type": dist_config.type,
+        "distribution": distribution,
+        "params": validated_params,
+        "support": dist_config.support,
+        "mean": mean,
+        "variance": var,
+        "std": std,
+        "q25": q25,
+        "median": q50,
+        "q75": q75,
+        "skewness": skewness,
+        "kurtosis": kurtosis
+    }
+
+
+def _auto_range(dist_name: str, params_tuple: Tuple[Tuple[str, float], ...]) -> Tuple[float, float]:
+    """自动确定绘图区间（参数已验证）"""
+    distribution = _freeze(dist_name, params_tuple)
+    dist_config = DISTRIBUTIONS[dist_name]
+    
+    if dist_config.type == "continuous":
+        if dist_config.plot_range is not None:
+            # 优先使用闭式绘图区间（均值 ± k·标准差等），省去两次数值求逆的 ppf
+            x_range = dist_config.plot_range(**dict(params_tuple))
+            if x_range is not None:
+                return x_range
+        # 一次调用同时求两端分位数；分位数无穷时改用均值 ± 4 倍标准差
+        x_min, x_max = distribution.ppf([0.001, 0.999])
+        if not (np.isfinite(x_min) and np.isfinite(x_max)):
+            mean, std = distribution.mean(), distribution.std()
+            if np.isfinite(mean) and np.isfinite(std):
+                if not np.isfinite(x_min):
+                    x_min = mean - 4 * std
+                if not np.isfinite(x_max):
+                    x_max = mean + 4 * std
+            else:
+                x_min, x_max = -5, 5
+    else:  # discrete
+        # 离散分布的 ppf(q) 即满足 CDF(k) ≥ q 的最小整数 k，两端各舍去一半尾部概率，
+        # 区间内的概率质量至少为 1 - DISCRETE_TAIL_MASS
+        low, median, high = distribution.ppf([DISCRETE_TAIL_MASS / 2, 0.5, 1 - DISCRETE_TAIL_MASS / 2])
+        if np.isfinite(low) and np.isfinite(high):
+            x_min = max(0, int(low))
+            x_max = int(high)
+            if x_max - x_min + 1 > DISCRETE_MAX_POINTS:
+                # 限制点数：以中位数为中心截取窗口
+                x_min = max(x_min, int(median) - DISCRETE_MAX_POINTS // 2)
+                x_max = min(x_max, x_min + DISCRETE_MAX_POINTS - 1)
+                x_min = x_max - DISCRETE_MAX_POINTS + 1
+        else:
+            x_min, x_max = 0, 20
+    
+    return x_min, x_max
+
+
+@functools.lru_cache(maxsize=8)
+def _grid(dist_type: str, x_min: float, x_max: float, num_points: int) -> np.ndarray:
+    """
+    构建横坐标：连续分布为 num_points 个等距点，离散分布为区间内的全部整数
+    
+    拖动参数滑块时区间通常不变，网格按区间缓存并在各次计算结果间共享（只读）
+    """
+    if dist_type != "continuous":
+        x = np.arange(int(x_min), int(x_max) + 1, dtype=np.int64)
+    else:
+        # 等距网格：x_min + i·step，原地乘加，末点直接取 x_max 以免舍入越界
+        x = np.arange(num_points, dtype=np.float64)
+        np.multiply(x, (x_max - x_min) / max(num_points - 1, 1), out=x)
+        np.add(x, x_min, out=x)
+        if num_points > 1:
+            x[-1] = x_max
+    
+    x.flags.writeable = False
+    return x
+
+
+@functools.lru_cache(maxsize=512)
+def _cached_pdf_pmf(dist_name: str, params_tuple: Tuple[Tuple[str, float], ...],
+                    x_range: Tuple[float, float],
+                    num_points: int) -> Tuple[np.ndarray, np.ndarray]:
+    """计算PDF或PMF（参数已验证），只需冻结分布对象，无需计算矩和分位数"""
+    distribution = _freeze(dist_name, params_tuple)
+    dist_type = DISTRIBUTIONS[dist_name].type
+    kernel = _FAST_DENSITIES.get(dist_name)
+    
+    if x_range is None:
+        x_range = _auto_range(dist_name, params_tuple)
+    x = _grid(dist_type, x_range[0], x_range[1], num_points)
+    
+    if kernel is not None:
+        y = kernel(x, *(float(value) for _, value in params_tuple), np.empty(x.shape))
+    elif dist_type == "continuous":
+        y = _continuous_pdf(dist_name, distribution, x, dict(params_tuple))
+    else:  # discrete
+        y = _discrete_pmf(dist_name, distribution, x, dict(params_tuple))
+    
+    # 结果会被缓存并在多次调用间共享，设为只读防止被意外修改（x 已是只读的共享网格）
+    y.flags.writeable = False
+    return x, y
+
+
+def _continuous_pdf(dist_name: str, distribution, x: np.ndarray,
+                    params: Dict[str, float]) -> np.ndarray:
+    """
+    直接调用分布类的 _pdf 计算PDF，跳过冻结分布对象的参数检查与类型提升
+    （参数已验证）：先按 loc/scale 标准化，再对支撑集内的点求密度并除以 scale；
+    支撑集外的密度为 0，出错时回退到公共 pdf
+    """
+    func = DISTRIBUTIONS[dist_name].func
+    shape_params = {key: value for key, value in params.items() if key not in ("loc", "scale")}
+    loc = params.get("loc", 0.0)
+    scale = params.get("scale", 1.0)
+    try:
+        low, high = func._get_support(**shape_params)
+        z = (x - loc) / scale
+        inside = (z >= low) & (z <= high)
+        y = np.zeros(x.shape)
+        y[inside] = func._pdf(z[inside], **shape_params) / scale
+    except Exception:
+        y = distribution.pdf(x)
+    return y
+
+
+def _discrete_pmf(dist_name: str, distribution, x: np.ndarray,
+                  shape_params: Dict[str, float]) -> np.ndarray:
+    """
+    直接调用分布类的 _pmf 计算PMF，跳过公共 pmf 的参数检查与类型提升
+    （参数已验证）；支撑集外的概率为 0，出错时回退到公共 pmf
+    """
+    func = DISTRIBUTIONS[dist_name].func
+    try:
+        low, high = func._get_support(**shape_params)
+        inside = (x >= low) & (x <= high)
+        y = np.zeros(x.shape)
+        y[inside] = func._pmf(x[inside], **shape_params)
+    except Exception:
+        y = distribution.pmf(x)
+    return y
+
 
 class DistributionExplorer:
     """概率分布探索器"""
     
-    def __init__(self):
-        self.distributions = {
-            # 连续分布
-            "正态分布": {
-                "type": "continuous",
-                "func": stats.norm,
-                "params": {
-                    "loc": {"name": "均值 (μ)", "default": 0, "min": -10, "max": 10, "step": 0.1},
-                    "scale": {"name": "标准差 (σ)", "default": 1, "min": 0.1, "max": 5, "step": 0.1}
-                },
-                "support": "(-∞, +∞)"
-            },
-            "均匀分布": {
-                "type": "continuous",
-                "func": stats.uniform,
-                "params": {
-                    "loc": {"name": "下界 (a)", "default": 0, "min": -5, "max": 5, "step": 0.1},
-                    "scale": {"name": "区间长度 (b-a)", "default": 1, "min": 0.1, "max": 10, "step": 0.1}
-                },
-                "support": "[a, b]"
-            },
-            "指数分布": {
-                "type": "continuous",
-                "func": stats.expon,
-                "params": {
-                    "scale": {"name": "尺度参数 (1/λ)", "default": 1, "min": 0.1, "max": 5, "step": 0.1}
-                },
-                "support": "[0, +∞)"
-            },
-            "伽马分布": {
-                "type": "continuous",
-                "func": stats.gamma,
-                "params": {
-                    "a": {"name": "形状参数 (α)", "default": 2, "min": 0.1, "max": 10, "step": 0.1},
-                    "scale": {"name": "尺度参数 (β)", "default": 1, "min": 0.1, "max": 5, "step": 0.1}
-                },
-                "support": "[0, +∞)"
-            },
-            "贝塔分布": {
-                "type": "continuous",
-                "func": stats.beta,
-                "params": {
-                    "a": {"name": "形状参数 (α)", "default": 2, "min": 0.1, "max": 10, "step": 0.1},
-                    "b": {"name": "形状参数 (β)", "default": 5, "min": 0.1, "max": 10, "step": 0.1}
-                },
-                "support": "[0, 1]"
-            },
-            "卡方分布": {
-                "type": "continuous",
-                "func": stats.chi2,
-                "params": {
-                    "df": {"name": "自由度 (ν)", "default": 3, "min": 1, "max": 20, "step": 1}
-                },
-                "support": "[0, +∞)"
-            },
-            "t分布": {
-                "type": "continuous",
-                "func": stats.t,
-                "params": {
-                    "df": {"name": "自由度 (ν)", "default": 5, "min": 1, "max": 30, "step": 1}
-                },
-                "support": "(-∞, +∞)"
-            },
-            "F分布": {
-                "type": "continuous",
-                "func": stats.f,
-                "params": {
-                    "dfn": {"name": "分子自由度", "default": 5, "min": 1, "max": 20, "step": 1},
-                    "dfd": {"name": "分母自由度", "default": 10, "min": 1, "max": 30, "step": 1}
-                },
-                "support": "[0, +∞)"
-            },
-            # 离散分布
-            "二项分布": {
-                "type": "discrete",
-                "func": stats.binom,
-                "params": {
-                    "n": {"name": "试验次数 (n)", "default": 10, "min": 1, "max": 100, "step": 1},
-                    "p": {"name": "成功概率 (p)", "default": 0.3, "min": 0.01, "max": 0.99, "step": 0.01}
-                },
-                "support": "{0, 1, 2, ..., n}"
-            },
-            "泊松分布": {
-                "type": "discrete",
-                "func": stats.poisson,
-                "params": {
-                    "mu": {"name": "强度参数 (λ)", "default": 3, "min": 0.1, "max": 20, "step": 0.1}
-                },
-                "support": "{0, 1, 2, ...}"
-            },
-            "几何分布": {
-                "type": "discrete",
-                "func": stats.geom,
-                "params": {
-                    "p": {"name": "成功概率 (p)", "default": 0.3, "min": 0.01, "max": 0.99, "step": 0.01}
-                },
-                "support": "{1, 2, 3, ...}"
-            },
-            "负二项分布": {
-                "type": "discrete",
-                "func": stats.nbinom,
-                "params": {
-                    "n": {"name": "成功次数 (r)", "default": 5, "min": 1, "max": 20, "step": 1},
-                    "p": {"name": "成功概率 (p)", "default": 0.3, "min": 0.01, "max": 0.99, "step": 0.01}
-                },
-                "support": "{0, 1, 2, ...}"
-            }
-        }
+    # 无实例状态：配置与缓存均在模块级共享
+    __slots__ = ()
+    
+    distributions = DISTRIBUTIONS
     
     def get_distribution_info(self, dist_name: str, params: Dict[str, float]) -> Dict[str, Any]:
         """获取分布信息"""
         if dist_name not in self.distributions:
             raise ValueError(f"不支持的分布: {dist_name}")
         
-        dist_config = self.distributions[dist_name]
-        
         # 验证参数
         validated_params = self._validate_params(dist_name, params)
         
-        # 创建分布对象
-        distribution = dist_config["func"](**validated_params)
-        
-        # 计算统计量
-        try:
-            mean = distribution.mean()
-            var = distribution.var()
-            std = distribution.std()
-            
-            # 对于连续分布，计算分位数
-            if dist_config["type"] == "continuous":
-                q25 = distribution.ppf(0.25)
-                q50 = distribution.ppf(0.5)  # 中位数
-                q75 = distribution.ppf(0.75)
-                skewness = distribution.stats(moments='s')
-                kurtosis = distribution.stats(moments='k')
-            else:
-                q25 = q50 = q75 = skewness = kurtosis = None
-                
-        except Exception as e:
-            mean = var = std = q25 = q50 = q75 = skewness = kurtosis = np.nan
-        
-        return {
-            "name": dist_name,
-            "type": dist_config["type"],
-            "distribution": distribution,
-            "params": validated_params,
-            "support": dist_config["support"],
-            "mean": mean,
-            "variance": var,
-            "std": std,
-            "q25": q25,
-            "median": q50,
-            "q75": q75,
-            "skewness": skewness,
-            "kurtosis": kurtosis
-        }
+        # 验证后的参数按配置顺序排列，可直接转为元组作为缓存键；
+        # 返回浅拷贝，避免调用方修改缓存中的结果
+        dist_info = dict(_cached_info(dist_name, tuple(validated_params.items())))
+        dist_info["params"] = dict(dist_info["params"])
+        return dist_info
     
     def _validate_params(self, dist_name: str, params: Dict[str, float]) -> Dict[str, float]:
         """验证和调整参数"""
-        dist_config = self.distributions[dist_name]
-        validated = {}
-        
-        for param_name, param_config in dist_config["params"].items():
-            value = params.get(param_name, param_config["default"])
-            
-            # 确保参数在有效范围内
-            min_val = param_config["min"]
-            max_val = param_config["max"]
-            validated[param_name] = max(min_val, min(max_val, value))
-        
-        return validated
+        # 确保参数在有效范围内
+        return _VALIDATORS[dist_name](params)
     
     def calculate_pdf_pmf(self, dist_name: str, params: Dict[str, float], 
                          x_range: Tuple[float, float] = None, 
                          num_points: int = 1000) -> Tuple[np.ndarray, np.ndarray]:
-        """计算PDF或PMF"""
-        dist_info = self.get_distribution_info(dist_name, params)
-        distribution = dist_info["distribution"]
-        dist_type = dist_info["type"]
+        """计算PDF或PMF（结果被缓存，返回的数组为只读）"""
+        if dist_name not in self.distributions:
+            raise ValueError(f"不支持的分布: {dist_name}")
         
-        if dist_type == "continuous":
-            if x_range is None:
-                # 自动确定范围
-                try:
-                    x_min = distribution.ppf(0.001)
-                    x_max = distribution.ppf(0.999)
-                    if np.isinf(x_min):
-                        x_min = distribution.mean() - 4 * distribution.std()
-                    if np.isinf(x_max):
-                        x_max = distribution.mean() + 4 * distribution.std()
-                except:
-                    x_min, x_max = -5, 5
-            else:
-                x_min, x_max = x_range
-            
-            x = np.linspace(x_min, x_max, num_points)
-            y = distribution.pdf(x)
-            
-        else:  # discrete
-            if x_range is None:
-                # 自动确定范围
-                try:
-                    x_min = max(0, int(distribution.ppf(0.001)))
-                    x_max = int(distribution.ppf(0.999))
-                    if x_max - x_min > 100:  # 限制点数
-                        x_max = x_min + 100
-                except:
-                    x_min, x_max = 0, 20
-            else:
-                x_min, x_max = int(x_range[0]), int(x_range[1])
+        validated_params = self._validate_params(dist_name, params)
+        if x_range is not None:
+            x_range = tuple(x_range)
+        return _cached_pdf_pmf(dist_name, tuple(validated_params.items()), x_range, num_points)
+    
+    def calculate_pdf_pmf_batch(self, dist_name: str, params_list: List[Dict[str, float]],
+                                x_range: Tuple[float, float] = None,
+                                num_points: int = 1000) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        一次计算一组参数下的PDF或PMF（参数扫描）
+        
+        各参数按列堆叠为形状 (K, 1) 的数组，与形状 (1, N) 的横坐标广播，
+        scipy 只需一次调用即可得到全部 K 条曲线。
+        
+        Args:
+            dist_name: 分布名称
+            params_list: K 组分布参数
+            x_range: 横坐标区间，默认取各组参数自动区间的并集
+            num_points: 连续分布的横坐标点数
             
-            x = np.arange(x_min, x_max + 1)
-            y = distribution.pmf(x)
+        Returns:
+            x: 形状为 (N,) 的横坐标
+            y: 形状为 (K, N) 的PDF/PMF值，第 k 行对应 params_list[k]
+        """
+        if dist_name not in self.distributions:
+            raise ValueError(f"不支持的分布: {dist_name}")
+        if not params_list:
+            raise ValueError("参数列表不能为空")
+        
+        dist_config = self.distributions[dist_name]
+        validated = [self._validate_params(dist_name, params) for params in params_list]
+        
+        if x_range is None:
+            ranges = [_auto_range(dist_name, tuple(params.items())) for params in validated]
+            x_range = (min(low for low, _ in ranges), max(high for _, high in ranges))
+        x = _grid(dist_config.type, x_range[0], x_range[1], num_points)
+        
+        columns = {
+            key: np.array([params[key] for params in validated], dtype=np.float64)[:, np.newaxis]
+            for key in validated[0]
+        }
+        if dist_config.type == "continuous":
+            y = dist_config.func.pdf(x[np.newaxis, :], **columns)
+        else:
+            y = dist_config.func.pmf(x[np.newaxis, :], **columns)
         
         return x, y
     
     def get_scenario_description(self, dist_name: str, params: Dict[str, float]) -> str:
         """获取实际应用场景描述"""
-        scenarios = {
-            "正态分布": f"身高分布：平均身高{params.get('loc', 0):.1f}cm，标准差{params.get('scale', 1):.1f}cm的人群身高分布。",
-            "均匀分布": f"随机数生成：在[{params.get('loc', 0):.1f}, {params.get('loc', 0) + params.get('scale', 1):.1f}]区间内均匀分布的随机数。",
-            "指数分布": f"设备寿命：平均寿命为{params.get('scale', 1):.1f}年的电子设备的寿命分布。",
-            "伽马分布": f"等待时间：等待第{params.get('a', 2):.0f}个客户到达的时间分布，平均间隔{params.get('scale', 1):.1f}分钟。",
-            "贝塔分布": f"成功率：在{params.get('a', 2):.0f}次成功和{params.get('b', 5):.0f}次失败后，真实成功率的分布。",
-            "卡方分布": f"方差检验：{params.get('df', 3):.0f}个独立标准正态变量平方和的分布。",
-            "t分布": f"小样本均值：样本量为{params.get('df', 5):.0f}+1的样本均值的标准化分布。",
-            "F分布": f"方差比检验：两个独立卡方分布（自由度{params.get('dfn', 5):.0f}和{params.get('dfd', 10):.0f}）比值的分布。",
-            "二项分布": f"质量控制：{params.get('n', 10):.0f}个产品中，每个产品合格率为{params.get('p', 0.3):.1%}时的合格产品数量分布。",
-            "泊松分布": f"客流统计：平均每小时有{params.get('mu', 3):.1f}位客户到达的商店客流分布。",
-            "几何分布": f"首次成功：成功概率为{params.get('p', 0.3):.1%}的试验中，首次成功所需的试验次数分布。",
-            "负二项分布": f"重复试验：成功概率为{params.get('p', 0.3):.1%}时，获得{params.get('n', 5):.0f}次成功所需的失败次数分布。"
-        }
-        return scenarios.get(dist_name, "暂无具体应用场景描述。")
+        template = _SCENARIO_TEMPLATES.get(dist_name)
+        if template is None:
+            return "暂无具体应用场景描述。"
+        return template.format_map(_ScenarioParams(params, _PARAM_DEFAULTS[dist_name]))
     
-    def get_available_distributions(self) -> Dict[str, List[str]]:
-        """获取可用的分布列表，按类型分组"""
-        continuous = []
-        discrete = []
-        
-        for name, config in self.distributions.items():
-            if config["type"] == "continuous":
-                continuous.append(name)
-            else:
-                discrete.append(name)
-        
-        return {"连续分布": continuous, "离散分布": discrete}
+    def get_available_distributions(self) -> Mapping[str, Tuple[str, ...]]:
+        """获取可用的分布列表，按类型分组（只读）"""
+        return _AVAILABLE_DISTRIBUTIONS
     
     def get_param_config(self, dist_name: str) -> Dict[str, Dict[str, Any]]:
         """获取分布的参数配置"""
         if dist_name not in self.distributions:
             raise ValueError(f"不支持的分布: {dist_name}")
         
-        return self.distributions[dist_name]["params"]
+        return {
+            spec.key: {
+                "name": spec.name,
+                "default": spec.default,
+                "min": spec.min,
+                "max": spec.max,
+                "step": spec.step
+            }
+            for spec in self.distributions[dist_name].params
+        }
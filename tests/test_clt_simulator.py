@@ -11,6 +11,9 @@ import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from src.utils.clt_simulator import CLTSimulator
+from scipy import stats
+
+from src.utils._fast import row_means, shapiro_royston
 
 
 class TestCLTSimulator:
@@ -39,6 +42,16 @@ class TestCLTSimulator:
         assert "theoretical_var" in dist_info
         assert "theoretical_std" in dist_info
     
+    def test_theoretical_moments_match_scipy(self):
+        """测试闭式理论矩与 scipy 计算结果一致"""
+        for dist_name in self.simulator.get_available_distributions():
+            dist_info = self.simulator.get_distribution_info(dist_name)
+            distribution = dist_info["distribution"]
+            
+            assert abs(dist_info["theoretical_mean"] - distribution.mean()) < 1e-12
+            assert abs(dist_info["theoretical_var"] - distribution.var()) < 1e-12
+            assert abs(dist_info["theoretical_std"] - distribution.std()) < 1e-12
+    
     def test_generate_population_sample(self):
         """测试生成总体样本"""
         sample = self.simulator.generate_population_sample("正态分布", size=1000)
@@ -47,6 +60,19 @@ class TestCLTSimulator:
         assert len(sample) == 1000
         assert np.isfinite(sample).all()
     
+    def test_rvs_fallback(self):
+        """测试没有对应 Generator 抽样函数的分布回退到 scipy rvs"""
+        self.simulator.distributions["t分布"] = {"func": stats.t, "params": {"df": 5}}
+        
+        sample = self.simulator.generate_population_sample("t分布", size=500)
+        sample_means, statistics = self.simulator.simulate_sampling(
+            "t分布", sample_size=10, num_samples=50
+        )
+        
+        assert len(sample) == 500
+        assert len(sample_means) == 50
+        assert abs(statistics["theoretical_mean"]) < 1e-12
+    
     def test_simulate_sampling(self):
         """测试模拟抽样过程"""
         sample_means, statistics = self.simulator.simulate_sampling(
@@ -125,6 +151,65 @@ class TestCLTSimulator:
         )
         assert len(sample_means) == 10
     
+    def test_chunked_sampling(self):
+        """测试抽样次数跨越多个分块时的结果"""
+        sample_means, statistics = self.simulator.simulate_sampling(
+            "二项分布", sample_size=10, num_samples=1300
+        )
+        
+        assert len(sample_means) == 1300
+        assert np.isfinite(sample_means).all()
+        # 每个分块都应被填入落在支撑集内的样本均值
+        assert np.all((sample_means >= 0) & (sample_means <= 10))
+    
+    def test_parallel_sampling(self):
+        """测试多线程并行抽样"""
+        sample_means, statistics = self.simulator.simulate_sampling(
+            "伽马分布", sample_size=20, num_samples=1300, n_jobs=2
+        )
+        
+        assert len(sample_means) == 1300
+        assert np.isfinite(sample_means).all()
+        assert np.all(sample_means > 0)
+        assert abs(statistics["sample_mean_mean"] - statistics["theoretical_mean"]) < 0.1
+    
+    def test_fast_mode(self):
+        """测试快速模式（单精度）抽样"""
+        sample_means, statistics = self.simulator.simulate_sampling(
+            "指数分布", sample_size=30, num_samples=200, fast_mode=True
+        )
+        
+        assert sample_means.dtype == np.float32
+        assert len(sample_means) == 200
+        assert isinstance(statistics["sample_mean_mean"], np.float64)
+        assert abs(statistics["sample_mean_mean"] - statistics["theoretical_mean"]) < 0.2
+        
+        # 单精度抽样函数（含平移、缩放）与双精度抽样的分布一致
+        for dist_name in ("均匀分布", "正态分布", "伽马分布", "卡方分布"):
+            sample = self.simulator._sampler(dist_name, float32=True)(np.random.default_rng(0), 20000)
+            info = self.simulator.get_distribution_info(dist_name)
+            
+            assert sample.dtype == np.float32
+            assert abs(sample.mean() - info["theoretical_mean"]) < 0.05 * max(1, info["theoretical_std"])
+            assert abs(sample.std() - info["theoretical_std"]) < 0.05 * info["theoretical_std"]
+    
+    def test_row_means(self):
+        """测试按行求均值内核"""
+        x = np.random.poisson(3, size=(50, 20))
+        
+        np.testing.assert_allclose(row_means(x), x.mean(axis=1))
+        np.testing.assert_allclose(row_means(x.astype(float)), x.mean(axis=1))
+    
+    def test_shapiro_royston(self):
+        """测试 Royston 近似的 Shapiro-Wilk 检验与 scipy 结果一致"""
+        rng = np.random.default_rng(0)
+        for sample in (rng.normal(size=100), rng.exponential(size=500)):
+            statistic, p_value = shapiro_royston(np.sort(sample))
+            expected = stats.shapiro(sample)
+            
+            assert abs(statistic - expected.statistic) < 1e-10
+            assert abs(p_value - expected.pvalue) < 1e-10
+    
     def test_invalid_distribution(self):
         """测试无效分布名称"""
         with pytest.raises(ValueError):
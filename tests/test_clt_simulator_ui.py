@@ -0,0 +1,43 @@
+"""
+中心极限定理模拟器界面组件测试
+"""
+
+import pytest
+import numpy as np
+import sys
+import os
+
+# 添加src目录到Python路径
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.components.clt_simulator_ui import (_cached_density_histogram, _histogram_bins,
+                                             _precomputed_population_hists)
+
+
+class TestCLTSimulatorUI:
+    """中心极限定理模拟器界面组件测试类"""
+    
+    def test_integer_population_histogram(self):
+        """测试整数取值的总体直方图使用单位宽度箱，内部没有空箱"""
+        for dist_name in ("泊松分布", "二项分布"):
+            counts, edges = _precomputed_population_hists()[dist_name]
+            
+            np.testing.assert_allclose(np.diff(edges), 1.0)
+            assert np.all(counts > 0)
+    
+    def test_integer_sample_means_histogram(self):
+        """测试样本量为 1 时整数取值的样本均值按整数分箱，密度不被窄箱放大"""
+        sample_means = np.random.default_rng(0).poisson(3, size=1000).astype(np.float64)
+        density, edges = _cached_density_histogram(sample_means)
+        
+        np.testing.assert_allclose(np.diff(edges), 1.0)
+        assert abs(density.sum() - 1.0) < 1e-12
+        assert density.max() < 0.3
+    
+    def test_continuous_histogram_bins(self):
+        """测试非整数数据保持等宽分箱"""
+        assert _histogram_bins(np.random.default_rng(0).normal(size=100), 50) == 50
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -6,11 +6,13 @@ import pytest
 import numpy as np
 import sys
 import os
+from collections.abc import Mapping
 
 # 添加src目录到Python路径
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from src.utils.distribution_explorer import DistributionExplorer
+from src.utils.distribution_explorer import (DISCRETE_MAX_POINTS, DISCRETE_TAIL_MASS,
+                                             DistributionExplorer)
 
 
 class TestDistributionExplorer:
@@ -24,13 +26,17 @@ class TestDistributionExplorer:
         """测试获取可用分布列表"""
         distributions = self.explorer.get_available_distributions()
         
-        assert isinstance(distributions, dict)
+        assert isinstance(distributions, Mapping)
         assert "连续分布" in distributions
         assert "离散分布" in distributions
         assert len(distributions["连续分布"]) > 0
         assert len(distributions["离散分布"]) > 0
         assert "正态分布" in distributions["连续分布"]
         assert "二项分布" in distributions["离散分布"]
+        
+        # 返回的分组为只读
+        with pytest.raises(TypeError):
+            distributions["连续分布"] = []
     
     def test_get_param_config(self):
         """测试获取参数配置"""
@@ -134,6 +140,32 @@ class TestDistributionExplorer:
         assert isinstance(description, str)
         assert len(description) > 0
     
+    def test_scenario_description_defaults(self):
+        """测试场景描述对缺失参数使用默认值，并计算派生字段"""
+        description = self.explorer.get_scenario_description("均匀分布", {"loc": 2})
+        assert "[2.0, 3.0]" in description
+        
+        description = self.explorer.get_scenario_description("二项分布", {})
+        assert "10个产品" in description and "30.0%" in description
+        
+        assert self.explorer.get_scenario_description("不存在的分布", {}) == "暂无具体应用场景描述。"
+    
+    def test_discrete_auto_range(self):
+        """测试离散分布的自动区间按累积概率确定，并限制点数"""
+        test_cases = [
+            ("泊松分布", {"mu": 0.5}),
+            ("二项分布", {"n": 100, "p": 0.3}),
+            ("负二项分布", {"n": 5, "p": 0.3}),
+        ]
+        
+        for dist_name, params in test_cases:
+            x, y = self.explorer.calculate_pdf_pmf(dist_name, params)
+            assert y.sum() >= 1 - DISCRETE_TAIL_MASS
+        
+        # 重尾分布的点数不超过上限
+        x, y = self.explorer.calculate_pdf_pmf("几何分布", {"p": 0.01})
+        assert len(x) == DISCRETE_MAX_POINTS
+    
     def test_custom_range(self):
         """测试自定义范围"""
         params = {"loc": 0, "scale": 1}
@@ -166,6 +198,124 @@ class TestDistributionExplorer:
             except Exception as e:
                 pytest.fail(f"分布 {dist_name} 测试失败: {str(e)}")
     
+    def test_discrete_pmf_matches_scipy(self):
+        """测试离散分布的PMF快速路径与 scipy 公共接口结果一致"""
+        test_cases = [
+            ("二项分布", {"n": 10, "p": 0.3}),
+            ("泊松分布", {"mu": 3}),
+            ("几何分布", {"p": 0.3}),
+            ("负二项分布", {"n": 5, "p": 0.3}),
+        ]
+        
+        for dist_name, params in test_cases:
+            # 自定义范围包含支撑集外的点
+            x, y = self.explorer.calculate_pdf_pmf(dist_name, params, (-3, 40))
+            expected = self.explorer.get_distribution_info(dist_name, params)["distribution"].pmf(x)
+            
+            np.testing.assert_allclose(y, expected, rtol=1e-12, atol=0)
+    
+    def test_continuous_pdf_matches_scipy(self):
+        """测试连续分布的PDF快速路径与 scipy 公共接口结果一致"""
+        test_cases = [
+            ("正态分布", {"loc": 1, "scale": 2}),
+            ("均匀分布", {"loc": -1, "scale": 3}),
+            ("指数分布", {"scale": 2}),
+            ("伽马分布", {"a": 2.5, "scale": 1.5}),
+            ("贝塔分布", {"a": 2, "b": 5}),
+            ("卡方分布", {"df": 3}),
+            ("t分布", {"df": 5}),
+            ("F分布", {"dfn": 5, "dfd": 10}),
+        ]
+        
+        for dist_name, params in test_cases:
+            # 自定义范围包含支撑集外的点
+            x, y = self.explorer.calculate_pdf_pmf(dist_name, params, (-5, 5))
+            expected = self.explorer.get_distribution_info(dist_name, params)["distribution"].pdf(x)
+            
+            np.testing.assert_allclose(y, expected, rtol=1e-12, atol=0)
+    
+    def test_calculate_pdf_pmf_batch(self):
+        """测试批量计算与逐组计算结果一致"""
+        test_cases = [
+            ("正态分布", [{"loc": 0, "scale": 1}, {"loc": 1, "scale": 2}, {"loc": -2, "scale": 0.5}], (-5, 5)),
+            ("伽马分布", [{"a": 1.5, "scale": 1}, {"a": 3, "scale": 2}], (0, 10)),
+            ("二项分布", [{"n": 10, "p": 0.3}, {"n": 20, "p": 0.5}], (0, 20)),
+        ]
+        
+        for dist_name, params_list, x_range in test_cases:
+            x, y = self.explorer.calculate_pdf_pmf_batch(dist_name, params_list, x_range)
+            assert y.shape == (len(params_list), len(x))
+            
+            for row, params in zip(y, params_list):
+                x_single, y_single = self.explorer.calculate_pdf_pmf(dist_name, params, x_range)
+                np.testing.assert_array_equal(x, x_single)
+                np.testing.assert_allclose(row, y_single, rtol=1e-12, atol=1e-300)
+        
+        # 未指定范围时取各组自动区间的并集
+        x, y = self.explorer.calculate_pdf_pmf_batch("正态分布", [{"scale": 1}, {"scale": 3}])
+        assert x.min() <= -12 and x.max() >= 12
+    
+    def test_cached_results(self):
+        """测试重复调用命中缓存且不会被调用方修改"""
+        params = {"n": 10, "p": 0.5}
+        
+        dist_info = self.explorer.get_distribution_info("二项分布", params)
+        dist_info["params"]["n"] = 99
+        dist_info["mean"] = -1
+        assert self.explorer.get_distribution_info("二项分布", params)["mean"] == 5
+        assert self.explorer.get_distribution_info("二项分布", params)["params"]["n"] == 10
+        
+        x1, y1 = self.explorer.calculate_pdf_pmf("二项分布", params)
+        x2, y2 = self.explorer.calculate_pdf_pmf("二项分布", params)
+        assert x1 is x2 and y1 is y2
+        assert not y1.flags.writeable
+        
+        # 区间相同时，不同参数的结果共享同一横坐标网格
+        x3, _ = self.explorer.calculate_pdf_pmf("正态分布", {"loc": 0, "scale": 1}, (-3, 3))
+        x4, _ = self.explorer.calculate_pdf_pmf("正态分布", {"loc": 1, "scale": 2}, (-3, 3))
+        assert x3 is x4
+        assert not x3.flags.writeable
+    
+    def test_analytic_plot_range(self):
+        """测试闭式绘图区间覆盖分布的主要概率质量"""
+        test_cases = [
+            ("正态分布", {"loc": 1, "scale": 2}),
+            ("均匀分布", {"loc": -1, "scale": 3}),
+            ("指数分布", {"scale": 2}),
+            ("伽马分布", {"a": 2, "scale": 1}),
+            ("伽马分布", {"a": 0.5, "scale": 1}),  # 回退到分位数
+            ("贝塔分布", {"a": 2, "b": 5}),
+            ("卡方分布", {"df": 3}),
+            ("t分布", {"df": 5}),
+            ("t分布", {"df": 1}),  # 回退到分位数
+        ]
+        
+        for dist_name, params in test_cases:
+            x, y = self.explorer.calculate_pdf_pmf(dist_name, params)
+            distribution = self.explorer.get_distribution_info(dist_name, params)["distribution"]
+            
+            assert np.isfinite(y).all()
+            assert distribution.cdf(x[-1]) - distribution.cdf(x[0]) >= 0.99
+        
+        # 均匀分布的区间覆盖支撑集两端的阶跃，端点处密度为 0
+        x, y = self.explorer.calculate_pdf_pmf("均匀分布", {"loc": 5.0, "scale": 5.05})
+        assert x[0] < 5.0 and x[-1] > 10.05
+        assert y[0] == 0 and y[-1] == 0
+    
+    def test_undefined_moments(self):
+        """测试矩不存在的分布（柯西分布）记为 NaN，分位数仍可计算"""
+        dist_info = self.explorer.get_distribution_info("t分布", {"df": 1})
+        assert np.isnan(dist_info["mean"])
+        assert np.isnan(dist_info["variance"])
+        assert abs(dist_info["median"]) < 1e-12
+        
+        dist_info = self.explorer.get_distribution_info("F分布", {"dfn": 5, "dfd": 2})
+        assert np.isnan(dist_info["mean"])
+        
+        dist_info = self.explorer.get_distribution_info("t分布", {"df": 5})
+        assert abs(dist_info["mean"]) < 1e-12
+        assert abs(dist_info["variance"] - 5 / 3) < 1e-12
+    
     def test_invalid_distribution(self):
         """测试无效分布名称"""
         with pytest.raises(ValueError):